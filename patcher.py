@@ -7,13 +7,16 @@ to swap file extensions without breaking cues or beatgrids.
 """
 
 import os
+import re
 import sys
+import mmap
 import shutil
+import time
 import subprocess
 import argparse
 from pathlib import Path
-from typing import List, Tuple, Dict, Set
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Tuple, Dict, Set, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 
 # Formats that need conversion to AIFF (5 chars → 5 chars)
 CONVERT_TO_AIFF = {".flac", ".alac"}
@@ -31,6 +34,29 @@ PDB_FORMAT_CODE_PATCHES: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {
     # ALAC codes unknown (no sample data); add entry once a sample PDB is available.
 }
 
+# FFmpeg executable, resolved once so spawns skip the PATH search
+FFMPEG_BIN = shutil.which("ffmpeg") or "ffmpeg"
+
+# Common FFmpeg options for every conversion
+FFMPEG_BASE_CMD = [
+    FFMPEG_BIN,
+    "-hide_banner",  # No version/configuration dump on start
+    "-nostdin",  # Never read from the terminal
+    "-loglevel", "error",  # Only show errors
+]
+
+# FFmpeg encoder arguments per target format
+FFMPEG_CODEC_ARGS: Dict[str, List[str]] = {
+    "aiff": ["-c:a", "pcm_s16be"],  # Standard AIFF codec (CD quality sources)
+    # CBR 320kbps: players seek VBR files by estimate, which shifts hot cues.
+    # compression_level is LAME's -q (0 = slowest); 2 is its recommended
+    # quality setting at a fraction of the encode time. Joint stereo is default.
+    "mp3": ["-c:a", "libmp3lame", "-b:a", "320k", "-compression_level", "2"],
+}
+
+# AIFF encoder for sources with more than 16 bits per sample (hi-res FLAC)
+AIFF_24BIT_CODEC_ARGS = ["-c:a", "pcm_s24be"]
+
 # Formats already compatible (no conversion needed)
 COMPATIBLE_FORMATS = {".mp3", ".aiff", ".aif", ".wav"}
 
@@ -40,137 +66,311 @@ CONVERTIBLE_FORMATS = CONVERT_TO_AIFF | CONVERT_TO_MP3
 # All known audio formats
 KNOWN_AUDIO_FORMATS = CONVERTIBLE_FORMATS | COMPATIBLE_FORMATS
 
+# Extension -> target format, "" for compatible files (one dict hit per file)
+EXT_TO_TARGET: Dict[str, str] = {ext: "aiff" for ext in CONVERT_TO_AIFF}
+EXT_TO_TARGET.update({ext: "mp3" for ext in CONVERT_TO_MP3})
+EXT_TO_TARGET.update({ext: "" for ext in COMPATIBLE_FORMATS})
 
-def get_target_format(src_ext: str) -> str:
-    """Get the appropriate target format based on source extension."""
-    src_ext = src_ext.lower()
-    if src_ext in CONVERT_TO_AIFF:
-        return "aiff"
-    elif src_ext in CONVERT_TO_MP3:
-        return "mp3"
-    else:
-        return ""  # No conversion needed
+# Every extension swap the patcher knows (used when patching without converting)
+DEFAULT_EXT_MAPPINGS: Dict[str, str] = {
+    ext: f".{target}" for ext, target in sorted(EXT_TO_TARGET.items()) if target
+}
+
+# Folders listed in parallel while scanning Contents
+SCAN_WORKERS = 8
+
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.1
 
 
 def check_ffmpeg() -> bool:
-    """Check if FFmpeg is available."""
-    try:
-        subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if FFmpeg is available on PATH (without spawning it)."""
+    return shutil.which(FFMPEG_BIN) is not None
 
 
-def find_audio_files(contents_dir: Path) -> Tuple[List[Path], List[Path], Set[str]]:
+def _progress_printer(total: int) -> Callable[..., None]:
     """
-    Find all audio files in the Contents directory.
+    Return a function that redraws a single-line progress bar for `total` items.
+    
+    Each bar keeps its own last-draw time and redraws at most once per
+    PROGRESS_INTERVAL; the first and last state are always drawn, so the bar
+    never ends short.
+    """
+    last_draw = 0.0
+    
+    def draw(done: int, label: str = "") -> None:
+        nonlocal last_draw
+        now = time.monotonic()
+        if 0 < done < total and now - last_draw < PROGRESS_INTERVAL:
+            return
+        last_draw = now
+        
+        pct = int(done / total * 100) if total else 100
+        bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
+        line = f"\r[{bar}] {done}/{total} ({pct}%)"
+        if label:
+            short_name = label if len(label) <= 30 else label[:27] + "..."
+            line += f" - {short_name:<30}"
+        print(line, end="", flush=True)
+    
+    return draw
+
+
+def _scan_folder(folder: str) -> Tuple[List[Tuple[Path, str, str]], List[Path], List[str]]:
+    """
+    List one folder and classify its files (see find_audio_files).
+    
+    The dirent type avoids extra stat calls, and a Path is only built for
+    files that turn out to be audio.
     
     Returns:
-        Tuple of (convertible_files, compatible_files, unknown_extensions)
+        Tuple of (convertible, compatible, subfolders); raises OSError if unreadable
     """
     convertible = []
     compatible = []
-    folder_count = 0
-    
-    print(f"Scanning: {contents_dir}", end="", flush=True)
+    subfolders = []
     
-    # Use os.walk for fast traversal (faster than glob on USB)
-    for root, dirs, files in os.walk(contents_dir):
-        folder_count += 1
-        if folder_count % 50 == 0:  # Show progress every 50 folders
-            print(".", end="", flush=True)
-        
-        for name in files:
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subfolders.append(entry.path)
+                continue
+            
+            name = entry.name
             # Skip macOS metadata files
             if name.startswith("._"):
                 continue
             
-            ext = os.path.splitext(name)[1].lower()
-            filepath = Path(root) / name
+            dot = name.rfind(".")
+            if dot < 0:
+                continue
             
-            if ext in CONVERTIBLE_FORMATS:
-                convertible.append(filepath)
-            elif ext in COMPATIBLE_FORMATS:
-                compatible.append(filepath)
+            ext = name[dot:].lower()
+            target_format = EXT_TO_TARGET.get(ext)
+            if target_format:
+                convertible.append((Path(entry.path), ext, target_format))
+            elif target_format is not None:
+                compatible.append(Path(entry.path))
+    
+    return convertible, compatible, subfolders
+
+
+def find_audio_files(contents_dir: Path) -> Tuple[List[Tuple[Path, str, str]], List[Path], Set[str]]:
+    """
+    Find all audio files in the Contents directory.
+    
+    Convertible files come with their lowercase extension and target format,
+    so later steps never parse the suffix again.
+    
+    Returns:
+        Tuple of (convertible (path, ext, target_format) list, compatible_files, unknown_extensions)
+    """
+    convertible = []
+    compatible = []
+    folder_count = 0
+    unreadable: List[str] = []
+    
+    print(f"Scanning: {contents_dir}", end="", flush=True)
+    
+    # Folders are listed in parallel, so the USB's per-directory latency
+    # overlaps instead of adding up. Each finished folder queues its
+    # subfolders; results and progress are handled in this thread only.
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_folder, str(contents_dir)): str(contents_dir)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                folder = pending.pop(future)
+                folder_count += 1
+                if folder_count % 50 == 0:  # Show progress every 50 folders
+                    print(".", end="", flush=True)
+                
+                try:
+                    found_convertible, found_compatible, subfolders = future.result()
+                except OSError:
+                    unreadable.append(folder)  # Skipped like os.walk does, but reported
+                    continue
+                
+                convertible += found_convertible
+                compatible += found_compatible
+                for subfolder in subfolders:
+                    pending[pool.submit(_scan_folder, subfolder)] = subfolder
+    
+    # Completion order varies between runs; keep conversion order stable
+    convertible.sort()
     
     print(f" done! ({folder_count} folders)")
+    if unreadable:
+        # Tracks in these folders stay unconverted, but the PDB patch still
+        # renames their references, so the user has to know about them.
+        print(f"⚠️  Could not read {len(unreadable)} folder(s), files inside were not converted:")
+        for folder in unreadable[:5]:
+            print(f"   {folder}")
     return convertible, compatible, set()
 
 
-def convert_file(src: Path, target_format: str, delete_original: bool = True) -> Tuple[bool, Path, str, str]:
+def convert_batch(jobs: List[Tuple[Path, Path, str]], threads: int = 0) -> List[Tuple[bool, Path, str, str]]:
     """
-    Convert a single audio file to the target format using FFmpeg.
+    Convert several audio files with a single FFmpeg process.
+    
+    Every job becomes one input and one output of the same command, so process
+    start-up and codec initialisation are paid once per batch instead of once
+    per file. If a batch fails, its files are retried one per process, so a
+    single broken input only fails itself. Sources are never deleted here;
+    the caller removes originals once their output is in place.
     
     Args:
-        src: Source file path
-        target_format: Target format ('aiff' or 'mp3')
-        delete_original: Whether to delete the source file after conversion
+        jobs: List of (source_path, output_path, target_format) tuples
+        threads: FFmpeg threads per input (0 = all cores; use 1 inside a worker pool)
         
     Returns:
-        Tuple of (success, output_path, filename, error_msg)
+        List of (success, output_path, filename, error_msg), one per job
     """
-    dst = src.with_suffix(f".{target_format}")
-    
-    # Base FFmpeg command with optimizations
-    base_cmd = [
-        "ffmpeg",
-        "-loglevel", "error",  # Only show errors
-        "-threads", "0",  # Use all available CPU cores
-        "-i", str(src),
-    ]
-    
-    # FFmpeg command based on target format
-    if target_format == "aiff":
-        cmd = base_cmd + [
-            "-c:a", "pcm_s16be",  # Standard AIFF codec
-            "-y",  # Overwrite
-            str(dst)
-        ]
-    elif target_format == "mp3":
-        cmd = base_cmd + [
-            "-c:a", "libmp3lame",
-            "-b:a", "320k",  # CBR 320kbps
-            "-compression_level", "0",  # Fastest encoding
-            "-y",
-            str(dst)
-        ]
-    else:
-        return False, dst, src.name, f"Unsupported format: {target_format}"
+    results: Dict[int, Tuple[bool, Path, str, str]] = {}
+    runnable: List[Tuple[int, Path, Path, str]] = []
+    for index, (src, dst, target_format) in enumerate(jobs):
+        if target_format in FFMPEG_CODEC_ARGS:
+            runnable.append((index, src, dst, target_format))
+        else:
+            results[index] = (False, dst, src.name, f"Unsupported format: {target_format}")
     
-    try:
-        result = subprocess.run(
-            cmd,
-            stdin=subprocess.DEVNULL,  # Prevent FFmpeg from waiting for input
-            capture_output=True,
-            check=True,
-            timeout=300  # 5 minute timeout per file
-        )
+    if runnable:
+        cmd = _build_ffmpeg_cmd([(src, dst, target_format) for _, src, dst, target_format in runnable], threads)
+        timeout = 300 * len(runnable)  # 5 minute timeout per file
+        try:
+            subprocess.run(
+                cmd,
+                stdin=subprocess.DEVNULL,  # Prevent FFmpeg from waiting for input
+                stdout=subprocess.DEVNULL,  # Output goes to a file, nothing to read
+                stderr=subprocess.PIPE,  # Only errors (-loglevel error), kept for reporting
+                check=True,
+                timeout=timeout
+            )
+            error_msg = ""
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+        except subprocess.TimeoutExpired:
+            error_msg = f"Timeout (>{timeout / 60:g}min)"
         
-        if delete_original and dst.exists():
-            src.unlink()
-            
-        return True, dst, src.name, ""
+        if error_msg and len(runnable) > 1:
+            # FFmpeg stops all outputs on the first bad input: find out which one
+            for index, src, dst, target_format in runnable:
+                results[index] = convert_batch([(src, dst, target_format)], threads)[0]
+            return [results[index] for index in range(len(jobs))]
         
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.decode() if e.stderr else str(e)
-        return False, dst, src.name, error_msg
-    except subprocess.TimeoutExpired:
-        return False, dst, src.name, "Timeout (>5min)"
+        for index, src, dst, _ in runnable:
+            if error_msg:
+                results[index] = (False, dst, src.name, error_msg)
+            else:
+                results[index] = (True, dst, src.name, "")
+    
+    return [results[index] for index in range(len(jobs))]
 
 
-def convert_all_files(contents_dir: Path, keep_originals: bool = False, max_workers: int = None, on_device: bool = False) -> Tuple[int, int, int, Dict[str, str]]:
+def _flac_bits_per_sample(path: Path) -> int:
+    """
+    Read the bit depth from a FLAC file's STREAMINFO block (0 if not FLAC).
+    
+    Avoids an ffprobe spawn per file: STREAMINFO is always the first metadata
+    block, right after the "fLaC" marker (and an ID3v2 tag, if a tagger added one).
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(10)
+            if header[:3] == b"ID3":
+                # Syncsafe tag size, plus 10 bytes if a footer is present
+                size = header[6] << 21 | header[7] << 14 | header[8] << 7 | header[9]
+                if header[5] & 0x10:
+                    size += 10
+                f.seek(10 + size)
+            else:
+                f.seek(0)
+            data = f.read(4 + 4 + 34)  # Marker, block header, STREAMINFO
+    except OSError:
+        return 0
+    
+    if len(data) < 42 or data[:4] != b"fLaC" or data[4] & 0x7F != 0:
+        return 0
+    streaminfo = data[8:]
+    # 5 bits (bits per sample - 1), straddling bytes 12 and 13
+    return ((streaminfo[12] & 0x01) << 4 | streaminfo[13] >> 4) + 1
+
+
+def _codec_args(src: Path, target_format: str) -> List[str]:
+    """Encoder arguments for one file, keeping the bit depth of hi-res FLAC."""
+    if target_format == "aiff" and _flac_bits_per_sample(src) > 16:
+        return AIFF_24BIT_CODEC_ARGS
+    return FFMPEG_CODEC_ARGS[target_format]
+
+
+def _build_ffmpeg_cmd(jobs: List[Tuple[Path, Path, str]], threads: int) -> List[str]:
+    """
+    Build one FFmpeg command converting each source to its output.
+    
+    Args:
+        jobs: List of (source_path, output_path, target_format)
+        threads: FFmpeg threads per input (0 = all cores)
+    
+    Returns:
+        FFmpeg command line
+    """
+    cmd = list(FFMPEG_BASE_CMD)
+    for src, _, _ in jobs:
+        cmd += ["-threads", str(threads), "-i", str(src)]  # Decoder threads (0 = all cores)
+    for input_index, (src, output, target_format) in enumerate(jobs):
+        # Only the first audio stream of its own input: embedded cover art is
+        # not re-encoded (players take artwork from the export, not the file)
+        cmd += ["-map", f"{input_index}:a:0"]
+        # Tags and chapters from the same input (FFmpeg defaults to input 0)
+        cmd += ["-map_metadata", str(input_index), "-map_chapters", str(input_index)]
+        # Explicit muxer, so the extension is never guessed
+        cmd += _codec_args(src, target_format) + ["-f", target_format, "-y", str(output)]  # Overwrite
+    return cmd
+
+
+def _ffmpeg_threads_per_invocation(workers: int) -> int:
+    """
+    FFmpeg threads for each of `workers` parallel conversions.
+    
+    Splits the CPU cores between the jobs instead of letting every FFmpeg
+    start one thread per core (workers x cores threads in total).
+    """
+    return max(1, (os.cpu_count() or workers) // workers)
+
+
+def _part_path(path: Path) -> Path:
+    """Temporary name a file is written under until it is complete."""
+    return path.with_name(path.name + ".part")
+
+
+def _chunked(items: list, size: int) -> List[list]:
+    """Split a list into consecutive chunks of at most `size` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _delete_originals(originals: List[Path]) -> None:
+    """Delete originals whose converted file is on the USB, in one serial sweep."""
+    if not originals:
+        return
+    print(f"Removing {len(originals)} original file(s)...")
+    for audio_file in originals:
+        try:
+            audio_file.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def convert_all_files(contents_dir: Path, keep_originals: bool = False, max_workers: int = None, on_device: bool = False, batch_size: int = 1, ffmpeg_threads: int = None) -> Tuple[int, int, int, Dict[str, str]]:
     """
     Convert all audio files. By default uses SSD caching for speed.
     
     Args:
         contents_dir: Directory containing audio files
         keep_originals: Whether to keep original files after conversion
-        max_workers: Max parallel conversions (default: 8 for SSD, 2 for on-device)
+        max_workers: Max parallel conversions (default: CPU cores for SSD, 2 for on-device)
         on_device: If True, convert directly on USB (slower but no temp space needed)
+        batch_size: Files converted per FFmpeg process (see convert_batch)
+        ffmpeg_threads: Threads per FFmpeg process (default: cores / workers)
     
     Returns:
         Tuple of (successful_count, skipped_count, failed_count, ext_mappings)
@@ -198,289 +398,343 @@ def convert_all_files(contents_dir: Path, keep_originals: bool = False, max_work
     # Group by extension and show conversion plan
     by_ext: Dict[str, int] = {}
     ext_mappings: Dict[str, str] = {}  # old_ext -> new_ext
-    for f in convertible:
-        ext = f.suffix.lower()
+    for _, ext, target_format in convertible:
         by_ext[ext] = by_ext.get(ext, 0) + 1
         if ext not in ext_mappings:
-            ext_mappings[ext] = f".{get_target_format(ext)}"
+            ext_mappings[ext] = f".{target_format}"
     
     print(f"Found {len(convertible)} file(s) to convert:")
     for ext, count in sorted(by_ext.items()):
         target = ext_mappings[ext]
         print(f"   {count} {ext} → {target}")
     
-    total = len(convertible)
-    
     if on_device:
         # Direct on-device conversion (slower)
         workers = max_workers if max_workers else 2
-        return _convert_on_device(convertible, total, workers, keep_originals, compatible, ext_mappings)
     else:
-        # SSD-cached conversion (faster)
-        workers = max_workers if max_workers else 8
-        return _convert_with_ssd_cache(convertible, contents_dir, total, workers, keep_originals, compatible, ext_mappings)
-
-
-def _convert_on_device(convertible: List[Path], total: int, workers: int, keep_originals: bool, compatible: List[Path], ext_mappings: Dict[str, str]) -> Tuple[int, int, int, Dict[str, str]]:
-    """Convert files directly on USB (slower, less temp space needed)."""
-    print(f"\nConverting {total} file(s) on device with {workers} workers...\n")
+        # SSD-cached conversion (faster): one single-threaded FFmpeg per core.
+        # Threads are enough, the encoding itself runs in the FFmpeg processes.
+        workers = max_workers if max_workers else (os.cpu_count() or 8)
     
-    success_count = 0
-    fail_count = 0
-    failed_files: List[str] = []
-    errors: List[str] = []
-    completed = [0]
+    threads = ffmpeg_threads if ffmpeg_threads else _ffmpeg_threads_per_invocation(workers)
     
-    import threading
-    lock = threading.Lock()
-    
-    def convert_one(audio_file: Path) -> Tuple[bool, str, str]:
-        target_format = get_target_format(audio_file.suffix)
-        success, _, name, error = convert_file(audio_file, target_format, delete_original=not keep_originals)
-        
-        with lock:
-            completed[0] += 1
-            pct = int(completed[0] / total * 100)
-            bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
-            short_name = name[:30] if len(name) <= 30 else name[:27] + "..."
-            print(f"\r[{bar}] {completed[0]}/{total} ({pct}%) - {short_name:<30}", end="", flush=True)
-        
-        return success, name, error
+    # Cache lives in the script folder (needed for resume check)
+    temp_dir = None if on_device else Path(__file__).parent / ".convert_cache"
     
-    print(f"[{'░' * 20}] 0/{total} (0%) - Starting...", end="", flush=True)
-    
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = [executor.submit(convert_one, f) for f in convertible]
-        for future in as_completed(futures):
-            success, name, error = future.result()
-            if success:
-                success_count += 1
-            else:
-                fail_count += 1
-                failed_files.append(name)
-                if error:
-                    errors.append(f"{name}: {error[:50]}")
-    
-    print()
-    
-    if failed_files:
-        print(f"\n⚠️  Failed: {len(failed_files)} file(s)")
-        for err in errors[:5]:
-            print(f"   {err}")
-    
-    return success_count, len(compatible), fail_count, ext_mappings
+    return _convert_pipeline(convertible, contents_dir, workers, threads, batch_size, keep_originals,
+                             compatible, ext_mappings, temp_dir)
 
 
-def _convert_with_ssd_cache(convertible: List[Path], contents_dir: Path, total: int, workers: int, keep_originals: bool, compatible: List[Path], ext_mappings: Dict[str, str]) -> Tuple[int, int, int, Dict[str, str]]:
-    """Convert files using local SSD for speed, then copy to USB."""
-    
-    # Create temp directory in script folder (needed for resume check)
-    script_dir = Path(__file__).parent
-    temp_dir = script_dir / ".convert_cache"
-    temp_dir.mkdir(exist_ok=True)
+def _convert_pipeline(convertible: List[Tuple[Path, str, str]], contents_dir: Path, workers: int, threads: int, batch_size: int, keep_originals: bool,
+                      compatible: List[Path], ext_mappings: Dict[str, str], temp_dir: Optional[Path]) -> Tuple[int, int, int, Dict[str, str]]:
+    """
+    Convert files in parallel, either through a local cache or directly on USB.
     
-    # Resume support: skip files already on USB or already in cache
-    to_convert = []
+    With temp_dir set, files are converted on the local SSD and copied to the
+    USB while the remaining conversions run; runs can be resumed. With
+    temp_dir None, FFmpeg writes next to the originals.
+    """
+    to_convert = convertible
     skipped_usb = 0
-    cached_ready: List[Tuple[Path, Path]] = []  # (temp_file, usb_dest) already converted in cache
-    for audio_file in convertible:
-        target_format = get_target_format(audio_file.suffix)
-        usb_dest = audio_file.with_suffix(f".{target_format}")
-        rel_path = audio_file.relative_to(contents_dir)
-        temp_file = temp_dir / rel_path.with_suffix(f".{target_format}")
+    cached_ready: List[Tuple[Path, Path, Path]] = []  # (original, temp_file, usb_dest) already converted in cache
+    # Originals whose converted file is safely on the USB
+    to_delete: List[Path] = []
+    
+    if temp_dir is not None:
+        # Resume support: skip files already on USB or already in cache.
+        # Files are only ever complete under their final name; .part files
+        # left by an interrupted run are ignored and overwritten on retry.
+        to_convert = []
+        for job in convertible:
+            audio_file, _, target_format = job
+            usb_dest = audio_file.with_suffix(f".{target_format}")
+            rel_path = audio_file.relative_to(contents_dir)
+            temp_file = temp_dir / rel_path.with_suffix(f".{target_format}")
+            
+            if usb_dest.exists() and usb_dest.stat().st_size > 0:
+                # Already converted and copied to USB
+                skipped_usb += 1
+                to_delete.append(audio_file)
+            elif temp_file.exists() and temp_file.stat().st_size > 0:
+                # Already converted in cache, just needs copying to USB
+                cached_ready.append((audio_file, temp_file, usb_dest))
+            else:
+                to_convert.append(job)
         
-        if usb_dest.exists() and usb_dest.stat().st_size > 0:
-            # Already converted and copied to USB
-            skipped_usb += 1
-        elif temp_file.exists() and temp_file.stat().st_size > 0:
-            # Already converted in cache, just needs copying to USB
-            cached_ready.append((temp_file, usb_dest))
-        else:
-            to_convert.append(audio_file)
-    
-    if skipped_usb > 0:
-        print(f"\n⏩ Resuming: skipped {skipped_usb} already on USB")
-    if cached_ready:
-        print(f"⏩ Resuming: {len(cached_ready)} file(s) found in cache, ready to copy")
-    
-    if not to_convert and not cached_ready:
-        print("All files already converted. Nothing to do.")
-        return skipped_usb, len(compatible), 0, ext_mappings
+        if skipped_usb > 0:
+            print(f"\n⏩ Resuming: skipped {skipped_usb} already on USB")
+        if cached_ready:
+            print(f"⏩ Resuming: {len(cached_ready)} file(s) found in cache, ready to copy")
+        
+        if not to_convert and not cached_ready:
+            print("All files already converted. Nothing to do.")
+            # Originals left behind by an interrupted run still go
+            if not keep_originals:
+                _delete_originals(to_delete)
+            return skipped_usb, len(compatible), 0, ext_mappings
+        
+        temp_dir.mkdir(exist_ok=True)
     
     total_to_convert = len(to_convert)
     
-    if total_to_convert > 0:
+    if temp_dir is None:
+        print(f"\nConverting {total_to_convert} file(s) on device with {workers} workers...\n")
+    elif total_to_convert > 0:
         print(f"\n Converting {total_to_convert} file(s) (Cached, {workers} workers)...")
         print(f"   Cache: {temp_dir}\n")
     
     success_count = 0
     fail_count = 0
-    failed_files: List[str] = []
     errors: List[str] = []
-    completed = [0]
-    converted_files: List[Tuple[Path, Path]] = list(cached_ready)  # start with cached files
     
-    import threading
-    lock = threading.Lock()
-    
-    def convert_one(audio_file: Path) -> Tuple[bool, str, str, Path, Path]:
-        """Convert to temp dir, return paths for later copy."""
-        target_format = get_target_format(audio_file.suffix)
-        
-        # Determine paths
-        rel_path = audio_file.relative_to(contents_dir)
-        temp_file = temp_dir / rel_path.with_suffix(f".{target_format}")
-        temp_file.parent.mkdir(parents=True, exist_ok=True)
-        usb_dest = audio_file.with_suffix(f".{target_format}")
-        
-        # Build FFmpeg command
-        base_cmd = [
-            "ffmpeg",
-            "-loglevel", "error",
-            "-threads", "0",
-            "-i", str(audio_file),
-        ]
-        
-        if target_format == "aiff":
-            cmd = base_cmd + ["-c:a", "pcm_s16be", "-y", str(temp_file)]
-        elif target_format == "mp3":
-            cmd = base_cmd + ["-c:a", "libmp3lame", "-b:a", "320k", "-compression_level", "0", "-y", str(temp_file)]
-        else:
-            return False, audio_file.name, f"Unknown format: {target_format}", temp_file, usb_dest
-        
-        try:
-            subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, check=True, timeout=300)
-            
-            with lock:
-                completed[0] += 1
-                pct = int(completed[0] / total_to_convert * 100)
-                bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
-                short_name = audio_file.name[:30] if len(audio_file.name) <= 30 else audio_file.name[:27] + "..."
-                print(f"\r[{bar}] {completed[0]}/{total_to_convert} ({pct}%) - {short_name:<30}", end="", flush=True)
+    def convert_chunk(batch: List[Tuple[Path, str, str]]) -> List[Tuple[bool, Path, str, Path, Path]]:
+        """Convert a batch, return each output file with its USB destination."""
+        results = []
+        jobs = []
+        outputs = []
+        usb_dests = []
+        for audio_file, _, target_format in batch:
+            usb_dest = audio_file.with_suffix(f".{target_format}")
             
-            return True, audio_file.name, "", temp_file, usb_dest
+            if temp_dir is None:
+                # On device: write straight to the final location
+                output = usb_dest
+            else:
+                rel_path = audio_file.relative_to(contents_dir)
+                output = temp_dir / rel_path.with_suffix(f".{target_format}")
+                output.parent.mkdir(parents=True, exist_ok=True)
             
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
-            return False, audio_file.name, error_msg, temp_file, usb_dest
-        except subprocess.TimeoutExpired:
-            return False, audio_file.name, "Timeout", temp_file, usb_dest
-    
-    # Step 1: Convert remaining files to SSD (fast, parallel)
-    if to_convert:
-        print(f"[{'░' * 20}] 0/{total_to_convert} (0%) - Starting...", end="", flush=True)
+            # FFmpeg writes a .part file that is renamed once complete, so an
+            # interrupted run never leaves a truncated file for resume to trust
+            jobs.append((audio_file, _part_path(output), target_format))
+            outputs.append(output)
+            usb_dests.append(usb_dest)
         
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = [executor.submit(convert_one, f) for f in to_convert]
-            for future in as_completed(futures):
-                success, name, error, temp_file, usb_dest = future.result()
+        # Originals are removed in one sweep at the end, once their
+        # converted file is known to be on the USB
+        batch_results = convert_batch(jobs, threads=threads)
+        for (success, part, _, error), (src, _, _), output, usb_dest in zip(batch_results, jobs, outputs, usb_dests):
+            try:
                 if success:
-                    success_count += 1
-                    converted_files.append((temp_file, usb_dest))
-                else:
-                    fail_count += 1
-                    failed_files.append(name)
-                    if error:
-                        errors.append(f"{name}: {error[:50]}")
-        
-        print()
+                    os.replace(part, output)
+                elif part.exists():
+                    part.unlink()
+            except OSError as e:
+                success, error = False, str(e)
+            results.append((success, src, error, output, usb_dest))
+        return results
     
-    if fail_count > 0:
-        print(f"\n⚠️  Failed: {fail_count} file(s)")
-        for err in errors[:5]:
-            print(f"   {err}")
+    # Cache on the same file system as the USB (e.g. script stored on the
+    # stick): a rename is enough, no data has to be copied.
+    same_device = temp_dir is not None and os.stat(temp_dir).st_dev == os.stat(contents_dir).st_dev
     
-    # Step 2: Copy converted files to USB
-    if converted_files:
-        print(f"\nCopying {len(converted_files)} file(s) to USB...")
-        print(f"[{'░' * 20}] 0/{len(converted_files)} (0%)", end="", flush=True)
-        
-        copy_failed = 0
-        for i, (temp_file, usb_dest) in enumerate(converted_files, 1):
+    def copy_one(src: Path, output: Path, usb_dest: Path) -> Tuple[Path, Path, str]:
+        part = _part_path(usb_dest)
+        try:
+            if same_device:
+                os.replace(output, usb_dest)
+            else:
+                # Data only: the player needs no permission bits or timestamps.
+                # Copied under a .part name and renamed, so a pulled stick or
+                # Ctrl-C never leaves a truncated file under the final name.
+                shutil.copyfile(output, part)
+                os.replace(part, usb_dest)
+                # Free the cache space right away, so the cache never holds
+                # much more than the files still being converted or copied
+                output.unlink()
+            return src, usb_dest, ""
+        except OSError as e:
             try:
-                shutil.copy(temp_file, usb_dest)
-            except OSError as e:
-                copy_failed += 1
-                print(f"\n   ⚠️  Copy failed: {usb_dest.name}: {e}")
-            
-            pct = int(i / len(converted_files) * 100)
-            bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
-            print(f"\r[{bar}] {i}/{len(converted_files)} ({pct}%)", end="", flush=True)
+                if part.exists():
+                    part.unlink()
+            except OSError:
+                pass
+            return src, usb_dest, str(e)
+    
+    # Copies to the USB run alongside the conversions: every finished file is
+    # handed to the copier right away instead of after the whole batch.
+    # Two copies in flight keep the USB busy; more only make writes compete.
+    with ThreadPoolExecutor(max_workers=2) as copier:
+        # Files converted by a previous run can go out immediately
+        copy_futures = [copier.submit(copy_one, src, temp_file, usb_dest) for src, temp_file, usb_dest in cached_ready]
         
-        print()
-        if copy_failed > 0:
-            print(f"   ⚠️  {copy_failed} file(s) failed to copy")
-            fail_count += copy_failed
+        # Step 1: Convert remaining files (parallel). Progress is only drawn
+        # from this thread, as results come in, so parallel workers never
+        # interleave their output.
+        if to_convert:
+            progress = _progress_printer(total_to_convert)
+            progress(0, "Starting...")
+            
+            completed = 0
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(convert_chunk, batch) for batch in _chunked(to_convert, batch_size)]
+                for future in as_completed(futures):
+                    for success, src, error, output, usb_dest in future.result():
+                        name = src.name
+                        if success:
+                            success_count += 1
+                            if temp_dir is None:
+                                to_delete.append(src)
+                            else:
+                                copy_futures.append(copier.submit(copy_one, src, output, usb_dest))
+                        else:
+                            fail_count += 1
+                            if error:
+                                errors.append(f"{name}: {error[:50]}")
+                        completed += 1
+                        progress(completed, name)
+            
+            print()
         
-        # Step 3: Delete originals from USB (if not keeping)
-        if not keep_originals:
-            print(f"Removing {len(convertible)} original file(s)...")
-            for audio_file in convertible:
-                if audio_file.exists():
-                    audio_file.unlink()
+        if fail_count > 0:
+            print(f"\n⚠️  Failed: {fail_count} file(s)")
+            for err in errors[:5]:
+                print(f"   {err}")
         
-        # Step 4: Clean up temp directory
+        # Step 2: Wait for the copies to the USB that are still running
+        if copy_futures:
+            action = "Moving" if same_device else "Copying"
+            print(f"\n{action} {len(copy_futures)} file(s) to USB...")
+            copy_progress = _progress_printer(len(copy_futures))
+            copy_progress(0)
+            
+            copy_failed = 0
+            for i, future in enumerate(as_completed(copy_futures), 1):
+                src, usb_dest, error = future.result()
+                if error:
+                    copy_failed += 1
+                    print(f"\n   ⚠️  Copy failed: {usb_dest.name}: {error}")
+                else:
+                    to_delete.append(src)
+                
+                copy_progress(i)
+            
+            print()
+            if copy_failed > 0:
+                print(f"   ⚠️  {copy_failed} file(s) failed to copy")
+                fail_count += copy_failed
+    
+    # Step 3: Delete originals from USB (if not keeping), in one serial sweep
+    # after all work is done. Failed files keep their original.
+    if not keep_originals:
+        _delete_originals(to_delete)
+    
+    if copy_futures:
+        # Step 4: Clean up temp directory (files are already gone, this
+        # removes the folder tree and anything left by failed conversions)
         print("🧹 Cleaning up cache...")
         shutil.rmtree(temp_dir, ignore_errors=True)
     
     return success_count + skipped_usb + len(cached_ready), len(compatible), fail_count, ext_mappings
 
 
-def patch_pdb(file_path: Path, old_ext: str, new_ext: str) -> bool:
+def backup_pdb(file_path: Path) -> Path:
     """
-    Patch a Rekordbox export.pdb file, replacing one extension with another.
+    Copy a PDB file to <name>.pdb.backup before it is patched in place.
+    
+    Must run once per file and run, before the first patch_pdb_multi() call, so the
+    backup holds the untouched export rather than a partially patched one.
+    
+    Returns:
+        Path of the backup file
+    """
+    backup_path = file_path.with_suffix(".pdb.backup")
+    shutil.copy2(file_path, backup_path)  # sendfile/fcopyfile, stays in the kernel
+    # Flush the backup to the device before the original is touched, so a USB
+    # stick pulled mid-patch always leaves one intact copy behind.
+    with open(backup_path, 'rb+') as f:
+        os.fsync(f.fileno())
+    print(f"Created backup: {backup_path.name}")
+    return backup_path
+
+
+def patch_pdb_multi(file_path: Path, ext_mappings: Dict[str, str]) -> bool:
+    """
+    Patch a Rekordbox PDB file for several extension mappings in a single pass.
+    
+    All patterns (extensions and their format-type codes) are combined into one
+    regex alternation, so the file is scanned once regardless of how many
+    mappings are given. The file is modified in place; create a backup with
+    backup_pdb() first.
     
     Args:
-        file_path: Path to the export.pdb file
-        old_ext: Extension to replace (e.g., ".flac")
-        new_ext: New extension (e.g., ".aiff")
+        file_path: Path to the PDB file
+        ext_mappings: Dictionary of old_ext -> new_ext (e.g. {'.flac': '.aiff'})
         
     Returns:
-        True if patching was successful, False otherwise
+        True if any track reference was patched, False otherwise
     """
     if not file_path.exists():
         print(f"Error: PDB file not found at {file_path}")
         return False
     
     # Validate extension lengths match
-    if len(old_ext) != len(new_ext):
-        print(f"Error: Extensions must be same length ({old_ext} vs {new_ext})")
-        print("This is required to preserve binary offsets in the database.")
-        return False
-    
-    # Create backup
-    backup_path = file_path.with_suffix(".pdb.backup")
-    shutil.copy2(file_path, backup_path)
-    print(f"Created backup: {backup_path.name}")
-    
-    # Read and patch
-    with open(file_path, 'rb') as f:
-        content = f.read()
-    
-    old_bytes = old_ext.encode('utf-8')
-    new_bytes = new_ext.encode('utf-8')
+    for old_ext, new_ext in ext_mappings.items():
+        if len(old_ext) != len(new_ext):
+            print(f"Error: Extensions must be same length ({old_ext} vs {new_ext})")
+            print("This is required to preserve binary offsets in the database.")
+            return False
     
-    count = content.count(old_bytes)
+    # pattern -> (replacement, extension mapping it belongs to)
+    patterns: Dict[bytes, Tuple[bytes, Tuple[str, str]]] = {}
+    for old_ext, new_ext in ext_mappings.items():
+        patterns[old_ext.encode('utf-8')] = (new_ext.encode('utf-8'), (old_ext, new_ext))
+    fmt_patterns: Set[bytes] = set()
+    for old_ext, new_ext in ext_mappings.items():
+        fmt_key = (old_ext.lower(), new_ext.lower())
+        if fmt_key in PDB_FORMAT_CODE_PATCHES:
+            old_fmt, new_fmt = PDB_FORMAT_CODE_PATCHES[fmt_key]
+            patterns[old_fmt] = (new_fmt, (old_ext, new_ext))
+            fmt_patterns.add(old_fmt)
     
-    if count == 0:
-        print(f"No '{old_ext}' references found in the PDB.")
-        return False
+    counts: Dict[bytes, int] = {pattern: 0 for pattern in patterns}
     
-    new_content = content.replace(old_bytes, new_bytes)
-
-    # Patch the binary format-type codes so the player knows the new container format.
-    fmt_key = (old_ext.lower(), new_ext.lower())
-    if fmt_key in PDB_FORMAT_CODE_PATCHES:
-        old_fmt, new_fmt = PDB_FORMAT_CODE_PATCHES[fmt_key]
-        fmt_count = new_content.count(old_fmt)
-        if fmt_count > 0:
-            new_content = new_content.replace(old_fmt, new_fmt)
-            print(f"Patched {fmt_count} format-type code(s): {old_fmt.hex()} → {new_fmt.hex()}")
-
-    with open(file_path, 'wb') as f:
-        f.write(new_content)
+    if patterns and file_path.stat().st_size > 0:
+        # Longest first so no pattern can shadow a longer one sharing its prefix
+        regex = re.compile(b"|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True)))
+        
+        # Patch in place: old and new patterns have the same length, so only the
+        # matched bytes need rewriting instead of reading and writing the whole file.
+        with open(file_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+            # The scan reads the file front to back: ask for aggressive
+            # readahead and start prefetching before the first page is touched.
+            for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                if hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+            
+            matches = [(m.start(), m.group()) for m in regex.finditer(mm)]
+            for _, pattern in matches:
+                counts[pattern] += 1
+            
+            # Format-type codes are only touched for mappings that have track
+            # references in this file, as with the per-extension patch.
+            referenced = {patterns[p][1] for p in patterns if p not in fmt_patterns and counts[p] > 0}
+            for start, pattern in matches:
+                new_bytes, mapping = patterns[pattern]
+                if pattern in fmt_patterns and mapping not in referenced:
+                    continue
+                mm[start:start + len(new_bytes)] = new_bytes
+            mm.flush()
+            os.fsync(f.fileno())
+    
+    patched_any = False
+    for old_ext, new_ext in ext_mappings.items():
+        count = counts[old_ext.encode('utf-8')]
+        if count == 0:
+            print(f"No '{old_ext}' references found in the PDB.")
+            continue
+        
+        fmt_key = (old_ext.lower(), new_ext.lower())
+        if fmt_key in PDB_FORMAT_CODE_PATCHES:
+            old_fmt, new_fmt = PDB_FORMAT_CODE_PATCHES[fmt_key]
+            if counts[old_fmt] > 0:
+                print(f"Patched {counts[old_fmt]} format-type code(s): {old_fmt.hex()} → {new_fmt.hex()}")
+        
         print(f"Patched {count} track reference(s): {old_ext} → {new_ext}")
-    return True
+        patched_any = True
+    
+    return patched_any
 
 
 
@@ -550,6 +804,25 @@ def patch_anlz_files(anlz_dir: Path, ext_mappings: Dict[str, str]) -> int:
     return patched_count
 
 
+def _find_entry(parent: Path, name: str) -> Path:
+    """
+    Return parent/name with the casing actually used on disk.
+    
+    One directory listing instead of a stat per casing variant. Falls back to
+    the given name if nothing matches (or the parent cannot be read).
+    """
+    try:
+        entries = os.listdir(parent)
+    except OSError:
+        return parent / name
+    
+    wanted = name.lower()
+    for entry in entries:
+        if entry.lower() == wanted:
+            return parent / entry
+    return parent / name
+
+
 def find_usb_paths(usb_path: Path) -> Tuple[Path, List[Path], Path]:
     """
     Find the Contents, all relevant PDB paths, and USBANLZ path from a USB root.
@@ -562,18 +835,9 @@ def find_usb_paths(usb_path: Path) -> Tuple[Path, List[Path], Path]:
     """
     contents_dir = usb_path / "Contents"
     
-    # Check casing for PIONEER/rekordbox
-    pioneer_dir = usb_path / "PIONEER"
-    if not pioneer_dir.exists():
-        # Try finding PIONEER case-insensitively if needed? 
-        # For now assume PIONEER is standard.
-        pass
-
-    rekordbox_dir = pioneer_dir / "rekordbox"
-    if not rekordbox_dir.exists():
-        rekordbox_dir = pioneer_dir / "Rekordbox"
-    if not rekordbox_dir.exists():
-        rekordbox_dir = pioneer_dir / "REKORDBOX"
+    # Casing of PIONEER/rekordbox varies between exports
+    pioneer_dir = _find_entry(usb_path, "PIONEER")
+    rekordbox_dir = _find_entry(pioneer_dir, "rekordbox")
     
     pdb_paths = []
     if rekordbox_dir.exists():
@@ -611,6 +875,9 @@ Examples:
   
   # Keep originals after conversion
   python patcher.py /Volumes/MY_USB --keep-originals
+  
+  # Limit the number of parallel conversions
+  python patcher.py /Volumes/MY_USB --jobs 4
 """
     )
     
@@ -639,6 +906,27 @@ Examples:
         action="store_true",
         help="Convert directly on USB (slower, but no temp space needed)"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of parallel conversions (default: CPU cores, or 2 with --on-device)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert N files per FFmpeg process (default: 1; larger values help with many short files)"
+    )
+    parser.add_argument(
+        "--ffmpeg-threads",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Threads per FFmpeg process (default: CPU cores divided by --jobs)"
+    )
     
     args = parser.parse_args()
     
@@ -666,6 +954,16 @@ Examples:
             print(f"Error: No export.pdb or exportExt.pdb found in PIONEER/rekordbox location.")
             sys.exit(1)
     
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        sys.exit(1)
+    if args.batch_size < 1:
+        print("Error: --batch-size must be at least 1")
+        sys.exit(1)
+    if args.ffmpeg_threads is not None and args.ffmpeg_threads < 1:
+        print("Error: --ffmpeg-threads must be at least 1")
+        sys.exit(1)
+    
     print(f"USB: {args.usb_path}")
     print("-" * 40)
     
@@ -677,7 +975,10 @@ Examples:
         success, skipped, failed, ext_mappings = convert_all_files(
             contents_dir,
             keep_originals=args.keep_originals,
-            on_device=args.on_device
+            max_workers=args.jobs,
+            on_device=args.on_device,
+            batch_size=args.batch_size,
+            ffmpeg_threads=args.ffmpeg_threads
         )
         print(f"\n✓ Converted: {success}, Skipped: {skipped}, Failed: {failed}")
         
@@ -698,13 +999,7 @@ Examples:
             else:
                 # If patch-only, we need to infer mappings or assume standard ones
                 print("   (Inferring mappings for patch-only mode...)")
-                ext_mappings = {
-                    ".flac": ".aiff",
-                    ".alac": ".aiff",
-                    ".m4a": ".mp3",
-                    ".ogg": ".mp3",
-                    ".wma": ".mp3"
-                }
+                ext_mappings = dict(DEFAULT_EXT_MAPPINGS)
         
         if not ext_mappings:
             print("   No text mappings found/needed. Skipping patch.")
@@ -713,14 +1008,10 @@ Examples:
             total_patched_pdbs = 0
             for pdb_path in pdb_paths:
                 print(f"   Target: {pdb_path.name}")
-                patched_any = False
-                
-                for old_ext, new_ext in ext_mappings.items():
-                    print(f"   Patching: {old_ext} → {new_ext}")
-                    if patch_pdb(pdb_path, old_ext, new_ext):
-                        patched_any = True
+                backup_pdb(pdb_path)
                 
-                if patched_any:
+                print(f"   Patching: {', '.join(f'{o} → {n}' for o, n in ext_mappings.items())}")
+                if patch_pdb_multi(pdb_path, ext_mappings):
                     total_patched_pdbs += 1
 
             